@@ -35,7 +35,7 @@ from .routes.analysis import router as analysis_router
 
 from .routes.social_auth import router as social_auth_router
 from .routes.social_posts import router as social_posts_router
-from .routes.config import router as config_router
+from .routes.config import router as config_router, set_agent_reloader
 
 from .routes.test_endpoints import router as test_router
 
@@ -57,6 +57,8 @@ async def reload_marketing_agent() -> SequentialAgent:
     marketing_agent = await create_marketing_orchestrator_agent()
     return marketing_agent
 
+set_agent_reloader(reload_marketing_agent)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for ADK agent initialization."""
@@ -204,6 +206,26 @@ async def health_check():
     logger.debug(f"Returning health status: {health_status}")
     return health_status
 
+@app.get("/health/live", response_model=dict)
+async def liveness_check():
+    """Liveness probe: the process is serving requests.
+
+    Touches no agent or configuration state, so it stays cheap for
+    load balancer and Kubernetes liveness probes.
+    """
+    return {"status": "live"}
+
+@app.get("/health/ready", response_model=dict)
+async def readiness_check():
+    """Readiness probe: the marketing agent is initialized and can take traffic.
+
+    Use this for readiness probes; /health remains the detailed status view.
+    """
+    if marketing_agent is None:
+        raise HTTPException(status_code=503, detail="Marketing agent not initialized")
+
+    return {"status": "ready"}
+
 @app.get("/api/v1/agent/status", response_model=dict)
 async def agent_status():
     """Get the status of the marketing orchestrator agent."""
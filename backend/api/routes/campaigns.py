@@ -10,7 +10,7 @@ import logging
 import time
 import os
 import json
-import uuid
+import secrets
 from typing import Dict, Any
 from datetime import datetime
 
@@ -100,7 +100,7 @@ async def create_campaign(
         logger.info(f"Creating campaign: {request.objective}")
         
         # Generate unique campaign ID for complete isolation
-        campaign_id = f"campaign_{uuid.uuid4().hex[:12]}_{int(time.time())}"
+        campaign_id = f"campaign_{secrets.token_hex(6)}_{int(time.time())}"
         
         # Create isolated campaign context
         isolated_context = create_isolated_campaign_context(campaign_id, request)
@@ -1,18 +1,82 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
+from typing import Awaitable, Callable, Optional
+import asyncio
+import logging
 import os
 
 from agents import marketing_orchestrator as orchestrator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Seconds a request waits for the agent reload before answering anyway
+RELOAD_CONFIRM_TIMEOUT = 5.0
+
+# Key-update coalescing: a burst of POSTs only marks a reload as pending, so it
+# collapses into one marketing agent reinitialization using the latest key.
+_reload_pending: bool = False
+_reload_task: Optional[asyncio.Task] = None
+
+# Agent reload hook. api.main imports this router before it defines
+# reload_marketing_agent, so main registers the hook via set_agent_reloader()
+# right after the definition instead of this module importing it.
+_reload_fn: Optional[Callable[[], Awaitable[object]]] = None
+
+def set_agent_reloader(reload_fn: Callable[[], Awaitable[object]]) -> None:
+    """Register the coroutine function used to reinitialize the marketing agent."""
+    global _reload_fn
+    _reload_fn = reload_fn
+
 class GeminiKeyRequest(BaseModel):
     gemini_api_key: str
 
+async def _reload_with_latest_key() -> None:
+    """Reload the marketing agent until no further reload is pending.
+
+    A failed reload is retried when a newer key arrived meanwhile, so the
+    latest key always gets an attempt; only the final failure is raised.
+    """
+    global _reload_pending
+    while _reload_pending:
+        _reload_pending = False
+        if _reload_fn is None:
+            logger.warning("No agent reloader registered; skipping marketing agent reload")
+            return
+        try:
+            await _reload_fn()
+        except Exception:
+            if not _reload_pending:
+                raise
+            logger.exception("Marketing agent reload failed; retrying with newer pending key")
+
+def _log_reload_failure(task: asyncio.Task) -> None:
+    """Log a failed reload, including ones no request is still waiting on."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(f"❌ Marketing agent reload failed: {exc}", exc_info=exc)
+
+def _schedule_reload() -> asyncio.Task:
+    """Return the in-flight reload task, starting one if none is running."""
+    global _reload_task
+    loop = asyncio.get_running_loop()
+    if _reload_task is None or _reload_task.done() or _reload_task.get_loop() is not loop:
+        _reload_task = loop.create_task(_reload_with_latest_key())
+        _reload_task.add_done_callback(_log_reload_failure)
+    return _reload_task
+
 @router.post("/config/gemini-key")
 async def set_gemini_key(req: GeminiKeyRequest):
+    global _reload_pending
     os.environ["GEMINI_API_KEY"] = req.gemini_api_key
     orchestrator.update_gemini_api_key(req.gemini_api_key)
-    from ..main import reload_marketing_agent
-    await reload_marketing_agent()
+    _reload_pending = True
+    reload_task = _schedule_reload()
+    try:
+        await asyncio.wait_for(asyncio.shield(reload_task), timeout=RELOAD_CONFIRM_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Marketing agent reload still running after key update; continuing in background")
     return {"success": True}
@@ -9,6 +9,19 @@ import os
 import sys
 from pathlib import Path
 
+# Core tables reported in the data counts section
+CORE_TABLES = {
+    'campaigns': 'Campaigns',
+    'users': 'Users',
+    'generated_content': 'Generated Content',
+    'campaign_templates': 'Campaign Templates',
+    'uploaded_files': 'Uploaded Files',
+    'user_sessions': 'User Sessions'
+}
+
+# Memory-mapped I/O window for status reads (256 MB)
+MMAP_SIZE = 256 * 1024 * 1024
+
 
 def check_database_status(db_path: str = "data/video_venture_launch.db"):
     """Check database status and display comprehensive information"""
@@ -18,8 +31,12 @@ def check_database_status(db_path: str = "data/video_venture_launch.db"):
         return False
     
     try:
-        conn = sqlite3.connect(db_path)
+        # Status checks never write: open read-only so no journal or write
+        # lock is taken, and let SQLite serve pages via mmap
+        db_uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(db_uri, uri=True, isolation_level=None)
         cursor = conn.cursor()
+        cursor.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
         
         print("✅ Database exists at", db_path)
         
@@ -27,37 +44,44 @@ def check_database_status(db_path: str = "data/video_venture_launch.db"):
         file_size = os.path.getsize(db_path) / (1024 * 1024)  # MB
         print(f"📁 Database size: {file_size:.2f} MB")
         
+        # Read tables, views and custom indexes from the schema in one pass
+        schema_objects = {'table': [], 'view': [], 'index': []}
+        cursor.execute(
+            "SELECT type, name FROM sqlite_master "
+            "WHERE type IN ('table', 'view') OR (type = 'index' AND name NOT LIKE 'sqlite_%') "
+            "ORDER BY name"
+        )
+        for object_type, name in cursor.fetchall():
+            schema_objects[object_type].append(name)
+        tables = schema_objects['table']
+        
         # List all tables
         print("📋 Tables:")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        tables = cursor.fetchall()
         
         if not tables:
             print("  - No tables found")
             return False
             
         for table in tables:
-            print(f"  - {table[0]}")
+            print(f"  - {table}")
         
         # Data counts
         print("📊 Data counts:")
         
-        # Core tables
-        table_counts = {
-            'campaigns': 'Campaigns',
-            'users': 'Users', 
-            'generated_content': 'Generated Content',
-            'campaign_templates': 'Campaign Templates',
-            'uploaded_files': 'Uploaded Files',
-            'user_sessions': 'User Sessions'
-        }
+        # Count every existing core table in a single round trip
+        existing_tables = set(tables)
+        counted_tables = [name for name in CORE_TABLES if name in existing_tables]
+        counts = {}
+        if counted_tables:
+            cursor.execute(" UNION ALL ".join(
+                f"SELECT '{name}', COUNT(*) FROM {name}" for name in counted_tables
+            ))
+            counts = dict(cursor.fetchall())
         
-        for table_name, display_name in table_counts.items():
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                count = cursor.fetchone()[0]
-                print(f"  - {display_name}: {count}")
-            except sqlite3.OperationalError:
+        for table_name, display_name in CORE_TABLES.items():
+            if table_name in counts:
+                print(f"  - {display_name}: {counts[table_name]}")
+            else:
                 print(f"  - {display_name}: N/A (table not found)")
         
         # Schema version
@@ -73,19 +97,17 @@ def check_database_status(db_path: str = "data/video_venture_launch.db"):
         
         # Views
         print("👁️  Views:")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='view' ORDER BY name")
-        views = cursor.fetchall()
+        views = schema_objects['view']
         
         if views:
             for view in views:
-                print(f"  - {view[0]}")
+                print(f"  - {view}")
         else:
             print("  - No views found")
         
         # Indexes
         print("🔍 Indexes:")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%' ORDER BY name")
-        indexes = cursor.fetchall()
+        indexes = schema_objects['index']
         
         if indexes:
             print(f"  - Total custom indexes: {len(indexes)}")
@@ -82,10 +82,8 @@ class BaseDBModel(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
+        # datetime fields serialize to ISO 8601 natively in pydantic v2
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 # ============================================================================
@@ -3,8 +3,15 @@ FILENAME: test_api_config.py
 DESCRIPTION/PURPOSE: API tests for configuration endpoints
 """
 
+import asyncio
+import logging
+
+import pytest
 from fastapi.testclient import TestClient
 
+from agents import marketing_orchestrator
+from api.routes import config as config_routes
+
 class TestConfigAPI:
     def test_set_gemini_key(self, client: TestClient):
         response = client.post("/api/v1/config/gemini-key", json={"gemini_api_key": "TESTKEY"})
@@ -15,3 +22,95 @@ class TestConfigAPI:
         assert health.status_code == 200
         assert health.json().get("gemini_key_configured") is True
 
+    def test_main_registers_agent_reloader(self):
+        from api.main import reload_marketing_agent
+
+        assert config_routes._reload_fn is reload_marketing_agent
+
+
+class TestGeminiKeyReload:
+    """Reload coalescing behind POST /config/gemini-key."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_reload_state(self, monkeypatch):
+        """Reset module-level reload state and restore the key afterwards."""
+        monkeypatch.setenv("GEMINI_API_KEY", "ORIGINAL")
+        monkeypatch.setattr(marketing_orchestrator, "GEMINI_API_KEY", marketing_orchestrator.GEMINI_API_KEY)
+        monkeypatch.setattr(config_routes, "_reload_pending", False)
+        monkeypatch.setattr(config_routes, "_reload_task", None)
+        monkeypatch.setattr(config_routes, "_reload_fn", None)
+
+    @staticmethod
+    def _key_request(key: str) -> config_routes.GeminiKeyRequest:
+        return config_routes.GeminiKeyRequest(gemini_api_key=key)
+
+    @pytest.mark.asyncio
+    async def test_burst_of_updates_coalesces_reloads(self):
+        calls = 0
+
+        async def counting_reload():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+
+        config_routes.set_agent_reloader(counting_reload)
+        results = await asyncio.gather(
+            *[config_routes.set_gemini_key(self._key_request(f"KEY{i}")) for i in range(20)]
+        )
+
+        assert all(result == {"success": True} for result in results)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_reload_answers_after_timeout_and_logs_failure(self, monkeypatch, caplog):
+        async def slow_failing_reload():
+            await asyncio.sleep(0.2)
+            raise RuntimeError("reload exploded")
+
+        monkeypatch.setattr(config_routes, "RELOAD_CONFIRM_TIMEOUT", 0.05)
+        config_routes.set_agent_reloader(slow_failing_reload)
+
+        with caplog.at_level(logging.ERROR, logger=config_routes.logger.name):
+            result = await config_routes.set_gemini_key(self._key_request("SLOWKEY"))
+            assert result == {"success": True}
+
+            await asyncio.wait([config_routes._reload_task])
+            await asyncio.sleep(0)
+
+        assert "reload exploded" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_failed_reload_is_raised_to_caller(self):
+        async def failing_reload():
+            raise RuntimeError("reload exploded")
+
+        config_routes.set_agent_reloader(failing_reload)
+
+        with pytest.raises(RuntimeError, match="reload exploded"):
+            await config_routes.set_gemini_key(self._key_request("BADKEY"))
+
+    @pytest.mark.asyncio
+    async def test_failed_reload_retries_newer_pending_key(self):
+        release_first = asyncio.Event()
+        calls = 0
+
+        async def first_fails_reload():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await release_first.wait()
+                raise RuntimeError("first reload failed")
+
+        config_routes.set_agent_reloader(first_fails_reload)
+
+        first = asyncio.create_task(config_routes.set_gemini_key(self._key_request("KEY_A")))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(config_routes.set_gemini_key(self._key_request("KEY_B")))
+        await asyncio.sleep(0)
+        release_first.set()
+
+        assert await second == {"success": True}
+        assert await first == {"success": True}
+        assert calls == 2
+        assert config_routes._reload_pending is False
+        assert marketing_orchestrator.GEMINI_API_KEY == "KEY_B"
@@ -0,0 +1,38 @@
+"""
+FILENAME: test_api_health.py
+DESCRIPTION/PURPOSE: API tests for liveness and readiness health probes
+
+This module tests the /health/live and /health/ready probe endpoints.
+"""
+
+from fastapi.testclient import TestClient
+
+import api.main as main_module
+
+
+class TestHealthProbes:
+    """Test suite for the health probe endpoints."""
+
+    def test_liveness_probe(self, client: TestClient):
+        """Liveness answers without touching agent state."""
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "live"}
+
+    def test_readiness_probe_agent_not_initialized(self, client: TestClient, monkeypatch):
+        """Readiness reports 503 until the marketing agent exists."""
+        monkeypatch.setattr(main_module, "marketing_agent", None)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+
+    def test_readiness_probe_agent_initialized(self, client: TestClient, monkeypatch):
+        """Readiness reports ready once the marketing agent is set."""
+        monkeypatch.setattr(main_module, "marketing_agent", object())
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}